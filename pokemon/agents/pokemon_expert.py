@@ -1,131 +1,240 @@
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
-from pydantic import BaseModel, Field
 
-from langchain_core.messages import HumanMessage
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+
 from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langgraph.prebuilt import create_react_agent
 from langchain_core.tools import tool
 
-from pokemon.core.config import ANTHROPIC_API_KEY
+from pokemon.agents.researcher import fetch_pokemon_data
+from pokemon.core.config import DEFAULT_MODEL, get_chat_model, get_llm_semaphore
 
 class BattleAnalysisResult(BaseModel):
     """Results of a Pokémon battle analysis"""
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     winner: str = Field(description="The Pokémon predicted to win the battle")
     reasoning: str = Field(description="Detailed reasoning for the prediction")
 
 
-@tool
-def get_type_effectiveness(attacking_type: str, defending_types: List[str]) -> Dict[str, Any]:
+# Type effectiveness chart (simplified version), built once at import time
+_TYPE_CHART = {
+    "normal": {"fighting": 2.0, "ghost": 0.0},
+    "fire": {"grass": 2.0, "ice": 2.0, "bug": 2.0, "steel": 2.0, 
+            "fire": 0.5, "water": 0.5, "rock": 0.5, "dragon": 0.5},
+    "water": {"fire": 2.0, "ground": 2.0, "rock": 2.0,
+             "water": 0.5, "grass": 0.5, "dragon": 0.5},
+    "electric": {"water": 2.0, "flying": 2.0, 
+                "electric": 0.5, "grass": 0.5, "dragon": 0.5, 
+                "ground": 0.0},
+    "grass": {"water": 2.0, "ground": 2.0, "rock": 2.0,
+             "fire": 0.5, "grass": 0.5, "poison": 0.5, "flying": 0.5, 
+             "bug": 0.5, "dragon": 0.5, "steel": 0.5},
+    "ice": {"grass": 2.0, "ground": 2.0, "flying": 2.0, "dragon": 2.0,
+           "fire": 0.5, "water": 0.5, "ice": 0.5, "steel": 0.5},
+    "fighting": {"normal": 2.0, "ice": 2.0, "rock": 2.0, "dark": 2.0, "steel": 2.0,
+                "poison": 0.5, "flying": 0.5, "psychic": 0.5, "bug": 0.5, "fairy": 0.5,
+                "ghost": 0.0},
+    "poison": {"grass": 2.0, "fairy": 2.0,
+              "poison": 0.5, "ground": 0.5, "rock": 0.5, "ghost": 0.5,
+              "steel": 0.0},
+    "ground": {"fire": 2.0, "electric": 2.0, "poison": 2.0, "rock": 2.0, "steel": 2.0,
+              "grass": 0.5, "bug": 0.5,
+              "flying": 0.0},
+    "flying": {"grass": 2.0, "fighting": 2.0, "bug": 2.0,
+              "electric": 0.5, "rock": 0.5, "steel": 0.5},
+    "psychic": {"fighting": 2.0, "poison": 2.0,
+               "psychic": 0.5, "steel": 0.5,
+               "dark": 0.0},
+    "bug": {"grass": 2.0, "psychic": 2.0, "dark": 2.0,
+           "fire": 0.5, "fighting": 0.5, "poison": 0.5, "flying": 0.5, 
+           "ghost": 0.5, "steel": 0.5, "fairy": 0.5},
+    "rock": {"fire": 2.0, "ice": 2.0, "flying": 2.0, "bug": 2.0,
+            "fighting": 0.5, "ground": 0.5, "steel": 0.5},
+    "ghost": {"psychic": 2.0, "ghost": 2.0,
+             "dark": 0.5,
+             "normal": 0.0},
+    "dragon": {"dragon": 2.0,
+              "steel": 0.5,
+              "fairy": 0.0},
+    "dark": {"psychic": 2.0, "ghost": 2.0,
+            "fighting": 0.5, "dark": 0.5, "fairy": 0.5},
+    "steel": {"ice": 2.0, "rock": 2.0, "fairy": 2.0,
+             "fire": 0.5, "water": 0.5, "electric": 0.5, "steel": 0.5},
+    "fairy": {"fighting": 2.0, "dragon": 2.0, "dark": 2.0,
+             "fire": 0.5, "poison": 0.5, "steel": 0.5}
+}
+
+# Integer ID for each type, used to index the dense effectiveness matrix
+_TYPE_ID = {name: i for i, name in enumerate(_TYPE_CHART)}
+
+# Dense (attacker, defender) -> multiplier matrix; unlisted matchups are neutral
+_EFFECT = np.ones((len(_TYPE_ID), len(_TYPE_ID)), dtype=np.float32)
+for _attacker, _row in _TYPE_CHART.items():
+    for _defender, _multiplier in _row.items():
+        _EFFECT[_TYPE_ID[_attacker], _TYPE_ID[_defender]] = _multiplier
+# The chart is immutable reference data; lock it so nothing can mutate
+# the shared table at runtime
+_EFFECT.setflags(write=False)
+
+# Matches "win"/"wins"/"winner"/"winning" but not e.g. "winter"
+_WIN_RE = re.compile(r"\bwin(?:s|ner|ning)?\b")
+
+
+def _verdict_re(pokemon1: str, pokemon2: str) -> re.Pattern:
+    """Regex matching a stated verdict that names either combatant."""
+    return re.compile(
+        rf"\b(?:{re.escape(pokemon1)}|{re.escape(pokemon2)})\b.{{0,120}}?\bwin",
+        re.IGNORECASE | re.DOTALL,
+    )
+
+
+def _ai_answer(message: Any) -> str:
+    """Return the message's text when it is AI-produced, else ''.
+
+    With stream_mode="values" the first streamed step echoes the input
+    state, so the human query must never be treated as analysis — its
+    own phrasing ("... to determine a winner") satisfies the verdict
+    regex and would end the stream before the agent runs.
     """
-    Calculate type effectiveness multipliers for an attacking type against defending types.
-    
-    Args:
-        attacking_type: The type of the attack (e.g., "Electric", "Fire")
-        defending_types: List of the defending Pokémon's types (e.g., ["Grass", "Poison"])
-        
-    Returns:
-        A dictionary with effectiveness information
+    if isinstance(message, AIMessage) and isinstance(message.content, str):
+        return message.content
+    return ""
+
+# Prompt for extracting a structured verdict from the free-form analysis
+_EXTRACT_PROMPT = """\
+Based on the following battle analysis between {pokemon1} and {pokemon2}, determine the winner and provide the reasoning.
+
+Battle Analysis:
+{analysis}
+
+Identify which Pokémon would win the battle and explain why.
+"""
+
+
+def _mentioned_pokemon(names: List[str], answer_lower: str) -> List[str]:
     """
-    # Type effectiveness chart (simplified version)
-    effectiveness_chart = {
-        "normal": {"fighting": 2.0, "ghost": 0.0},
-        "fire": {"grass": 2.0, "ice": 2.0, "bug": 2.0, "steel": 2.0, 
-                "fire": 0.5, "water": 0.5, "rock": 0.5, "dragon": 0.5},
-        "water": {"fire": 2.0, "ground": 2.0, "rock": 2.0,
-                 "water": 0.5, "grass": 0.5, "dragon": 0.5},
-        "electric": {"water": 2.0, "flying": 2.0, 
-                    "electric": 0.5, "grass": 0.5, "dragon": 0.5, 
-                    "ground": 0.0},
-        "grass": {"water": 2.0, "ground": 2.0, "rock": 2.0,
-                 "fire": 0.5, "grass": 0.5, "poison": 0.5, "flying": 0.5, 
-                 "bug": 0.5, "dragon": 0.5, "steel": 0.5},
-        "ice": {"grass": 2.0, "ground": 2.0, "flying": 2.0, "dragon": 2.0,
-               "fire": 0.5, "water": 0.5, "ice": 0.5, "steel": 0.5},
-        "fighting": {"normal": 2.0, "ice": 2.0, "rock": 2.0, "dark": 2.0, "steel": 2.0,
-                    "poison": 0.5, "flying": 0.5, "psychic": 0.5, "bug": 0.5, "fairy": 0.5,
-                    "ghost": 0.0},
-        "poison": {"grass": 2.0, "fairy": 2.0,
-                  "poison": 0.5, "ground": 0.5, "rock": 0.5, "ghost": 0.5,
-                  "steel": 0.0},
-        "ground": {"fire": 2.0, "electric": 2.0, "poison": 2.0, "rock": 2.0, "steel": 2.0,
-                  "grass": 0.5, "bug": 0.5,
-                  "flying": 0.0},
-        "flying": {"grass": 2.0, "fighting": 2.0, "bug": 2.0,
-                  "electric": 0.5, "rock": 0.5, "steel": 0.5},
-        "psychic": {"fighting": 2.0, "poison": 2.0,
-                   "psychic": 0.5, "steel": 0.5,
-                   "dark": 0.0},
-        "bug": {"grass": 2.0, "psychic": 2.0, "dark": 2.0,
-               "fire": 0.5, "fighting": 0.5, "poison": 0.5, "flying": 0.5, 
-               "ghost": 0.5, "steel": 0.5, "fairy": 0.5},
-        "rock": {"fire": 2.0, "ice": 2.0, "flying": 2.0, "bug": 2.0,
-                "fighting": 0.5, "ground": 0.5, "steel": 0.5},
-        "ghost": {"psychic": 2.0, "ghost": 2.0,
-                 "dark": 0.5,
-                 "normal": 0.0},
-        "dragon": {"dragon": 2.0,
-                  "steel": 0.5,
-                  "fairy": 0.0},
-        "dark": {"psychic": 2.0, "ghost": 2.0,
-                "fighting": 0.5, "dark": 0.5, "fairy": 0.5},
-        "steel": {"ice": 2.0, "rock": 2.0, "fairy": 2.0,
-                 "fire": 0.5, "water": 0.5, "electric": 0.5, "steel": 0.5},
-        "fairy": {"fighting": 2.0, "dragon": 2.0, "dark": 2.0,
-                 "fire": 0.5, "poison": 0.5, "steel": 0.5}
-    }
-    
-    # Normalize input
+    Return the candidate names that appear in the (already lowercased) answer.
+
+    Scans the answer once per candidate with C-level substring search; for
+    the duel-sized name lists used here this beats building a multi-pattern
+    automaton per call, and callers get the same which-names-matched result.
+    """
+    return [name for name in names if name.lower() in answer_lower]
+
+
+def _type_effectiveness(attacking_type: str, defending_types: List[str]) -> Dict[str, Any]:
+    """Pure implementation of the type effectiveness calculation for internal callers."""
+    # Normalize, dedupe, and map to type IDs in a single pass so a repeated
+    # defending type cannot over-multiply the result
     attacking_type = attacking_type.lower()
-    defending_types = [dt.lower() for dt in defending_types]
-    
-    # Calculate effectiveness
-    multiplier = 1.0
-    for defending_type in defending_types:
-        if defending_type in effectiveness_chart.get(attacking_type, {}):
-            multiplier *= effectiveness_chart[attacking_type][defending_type]
-    
-    effectiveness = "neutral"
-    if multiplier > 1.0:
-        effectiveness = "super effective"
-    elif multiplier < 1.0 and multiplier > 0.0:
-        effectiveness = "not very effective"
-    elif multiplier == 0.0:
-        effectiveness = "no effect"
+    att_id = _TYPE_ID.get(attacking_type)
+    normalized = []
+    def_ids = []
+    for dt in defending_types:
+        dt = dt.lower()
+        if dt in normalized:
+            continue
+        normalized.append(dt)
+        type_id = _TYPE_ID.get(dt)
+        if type_id is not None:
+            def_ids.append(type_id)
+    defending_types = normalized
+
+    if att_id is None or not def_ids:
+        multiplier = 1.0
+    else:
+        multiplier = float(_EFFECT[att_id, def_ids].prod())
 
     return {
         "attacking_type": attacking_type.capitalize(),
         "defending_types": [dt.capitalize() for dt in defending_types],
         "multiplier": multiplier,
-        "effectiveness": effectiveness
+        "effectiveness": _effect_label(multiplier)
     }
 
+
+def _effect_label(multiplier: float) -> str:
+    """Human-readable effectiveness label for a multiplier."""
+    if multiplier > 1.0:
+        return "super effective"
+    if multiplier == 0.0:
+        return "no effect"
+    if multiplier < 1.0:
+        return "not very effective"
+    return "neutral"
+
+
+def _matchup_effects(attacking_types: List[str], defending_types: List[str]) -> List[Dict[str, Any]]:
+    """
+    Effect dicts for every attacking type against one defending type set.
+
+    Computes all multipliers with a single np.ix_ gather over the dense
+    effectiveness matrix instead of one lookup pass per attacking type.
+    """
+    def_norm = []
+    for dt in defending_types:
+        dt = dt.lower()
+        if dt not in def_norm:
+            def_norm.append(dt)
+    def_ids = [_TYPE_ID[dt] for dt in def_norm if dt in _TYPE_ID]
+
+    att_norm = [at.lower() for at in attacking_types]
+    att_ids = [_TYPE_ID.get(at) for at in att_norm]
+    known = [i for i, att_id in enumerate(att_ids) if att_id is not None]
+
+    multipliers = np.ones(len(att_norm), dtype=np.float32)
+    if known and def_ids:
+        multipliers[known] = _EFFECT[
+            np.ix_([att_ids[i] for i in known], def_ids)
+        ].prod(axis=1)
+
+    defending_caps = [dt.capitalize() for dt in def_norm]
+    return [
+        {
+            "attacking_type": at.capitalize(),
+            "defending_types": defending_caps,
+            "multiplier": float(multiplier),
+            "effectiveness": _effect_label(float(multiplier))
+        }
+        for at, multiplier in zip(att_norm, multipliers)
+    ]
+
+
 @tool
-def analyze_stats_comparison(stats1: Dict[str, int], stats2: Dict[str, int]) -> Dict[str, Any]:
+def get_type_effectiveness(attacking_type: str, defending_types: List[str]) -> Dict[str, Any]:
     """
-    Compare the base stats of two Pokémon and determine advantages.
-    
+    Calculate type effectiveness multipliers for an attacking type against defending types.
+
     Args:
-        stats1: Dictionary of the first Pokémon's stats
-        stats2: Dictionary of the second Pokémon's stats
-        
+        attacking_type: The type of the attack (e.g., "Electric", "Fire")
+        defending_types: List of the defending Pokémon's types (e.g., ["Grass", "Poison"])
+
     Returns:
-        Analysis of the stat comparison
+        A dictionary with effectiveness information
     """
+    return _type_effectiveness(attacking_type, defending_types)
+
+
+def _stats_comparison(stats1: Dict[str, int], stats2: Dict[str, int]) -> Dict[str, Any]:
+    """Pure implementation of the stat comparison for internal callers."""
     # Calculate total base stats
     total1 = sum(stats1.values())
     total2 = sum(stats2.values())
-    
-    # Determine stat advantages for each Pokémon
-    advantages1 = []
-    advantages2 = []
-    
-    for stat in stats1:
-        if stat in stats2:
-            if stats1[stat] > stats2[stat]:
-                advantages1.append(stat)
-            elif stats2[stat] > stats1[stat]:
-                advantages2.append(stat)
-    
+
+    # Determine stat advantages with vectorized compares over the shared stats
+    shared = [stat for stat in stats1 if stat in stats2]
+    a = np.fromiter((stats1[s] for s in shared), dtype=np.int16, count=len(shared))
+    b = np.fromiter((stats2[s] for s in shared), dtype=np.int16, count=len(shared))
+
+    advantages1 = [shared[i] for i in np.flatnonzero(a > b)]
+    advantages2 = [shared[i] for i in np.flatnonzero(b > a)]
+
     # Speed is often crucial in battles
     speed_advantage = None
     if "speed" in stats1 and "speed" in stats2:
@@ -144,7 +253,22 @@ def analyze_stats_comparison(stats1: Dict[str, int], stats2: Dict[str, int]) ->
         "speed_advantage": speed_advantage
     }
 
-    
+
+@tool
+def analyze_stats_comparison(stats1: Dict[str, int], stats2: Dict[str, int]) -> Dict[str, Any]:
+    """
+    Compare the base stats of two Pokémon and determine advantages.
+
+    Args:
+        stats1: Dictionary of the first Pokémon's stats
+        stats2: Dictionary of the second Pokémon's stats
+
+    Returns:
+        Analysis of the stat comparison
+    """
+    return _stats_comparison(stats1, stats2)
+
+
 @tool
 def compare_pokemon_data(pokemon1_name: str, pokemon2_name: str) -> Dict[str, Any]:
     """
@@ -157,11 +281,12 @@ def compare_pokemon_data(pokemon1_name: str, pokemon2_name: str) -> Dict[str, An
     Returns:
         Comprehensive comparison data
     """
-    from pokemon.agents.researcher import get_pokemon_data
-
-    # Get data for both Pokémon (using the imported researcher function)
-    pokemon1_data = get_pokemon_data.invoke(pokemon1_name)
-    pokemon2_data = get_pokemon_data.invoke(pokemon2_name)
+    # Get data for both Pokémon concurrently (the two lookups are independent),
+    # calling the plain fetch function rather than going through tool dispatch
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pokemon1_data, pokemon2_data = executor.map(
+            fetch_pokemon_data, [pokemon1_name, pokemon2_name]
+        )
     
     # Check if either Pokémon wasn't found
     if isinstance(pokemon1_data, str) and "not found" in pokemon1_data:
@@ -172,29 +297,19 @@ def compare_pokemon_data(pokemon1_name: str, pokemon2_name: str) -> Dict[str, An
     # Calculate type effectiveness in both directions
     type_effectiveness = {}
     if "types" in pokemon1_data and "types" in pokemon2_data:
-        # Pokémon 1's attacks against Pokémon 2
-        for attack_type in pokemon1_data["types"]:
-            effect = get_type_effectiveness.invoke({
-                "attacking_type": attack_type, 
-                "defending_types": pokemon2_data["types"]
-            })
+        # Both directions come from one matrix gather per side
+        effects1 = _matchup_effects(pokemon1_data["types"], pokemon2_data["types"])
+        for attack_type, effect in zip(pokemon1_data["types"], effects1):
             type_effectiveness[f"{pokemon1_data['name']}_{attack_type}_vs_{pokemon2_data['name']}"] = effect
-        
-        # Pokémon 2's attacks against Pokémon 1
-        for attack_type in pokemon2_data["types"]:
-            effect = get_type_effectiveness.invoke({
-                "attacking_type": attack_type, 
-                "defending_types": pokemon1_data["types"]
-            })
+
+        effects2 = _matchup_effects(pokemon2_data["types"], pokemon1_data["types"])
+        for attack_type, effect in zip(pokemon2_data["types"], effects2):
             type_effectiveness[f"{pokemon2_data['name']}_{attack_type}_vs_{pokemon1_data['name']}"] = effect
     
     # Compare stats
     stats_comparison = {}
     if "stats" in pokemon1_data and "stats" in pokemon2_data:
-        stats_comparison = analyze_stats_comparison.invoke({
-            "stats1": pokemon1_data["stats"], 
-            "stats2": pokemon2_data["stats"]
-        })
+        stats_comparison = _stats_comparison(pokemon1_data["stats"], pokemon2_data["stats"])
     
     return {
         "pokemon1": pokemon1_data,
@@ -204,21 +319,63 @@ def compare_pokemon_data(pokemon1_name: str, pokemon2_name: str) -> Dict[str, An
     }
 
 
+# System message that provides context about the agent's purpose
+_EXPERT_SYSTEM = """\
+You are a Pokémon Battle Expert with extensive knowledge of Pokémon battles, type matchups, and competitive strategy.
+
+When analyzing battles between two Pokémon:
+1. Consider their types and type effectiveness (which types are strong/weak against others)
+2. Analyze their base stats (speed is often crucial in determining who attacks first)
+3. Consider their typical movesets and abilities
+4. Provide a clear prediction with detailed reasoning
+
+Type effectiveness chart (multipliers for attacking types against defending types):
+- Normal: weak to Fighting (x2); immune to Ghost (x0)
+- Fire: strong against Grass, Ice, Bug, Steel (x2); weak against Water, Rock, Fire, Dragon (x0.5)
+- Water: strong against Fire, Ground, Rock (x2); weak against Water, Grass, Dragon (x0.5)
+- Electric: strong against Water, Flying (x2); weak against Electric, Grass, Dragon (x0.5); no effect on Ground (x0)
+- Grass: strong against Water, Ground, Rock (x2); weak against Fire, Grass, Poison, Flying, Bug, Dragon, Steel (x0.5)
+- Ice: strong against Grass, Ground, Flying, Dragon (x2); weak against Fire, Water, Ice, Steel (x0.5)
+- Fighting: strong against Normal, Ice, Rock, Dark, Steel (x2); weak against Poison, Flying, Psychic, Bug, Fairy (x0.5); no effect on Ghost (x0)
+- Poison: strong against Grass, Fairy (x2); weak against Poison, Ground, Rock, Ghost (x0.5); no effect on Steel (x0)
+- Ground: strong against Fire, Electric, Poison, Rock, Steel (x2); weak against Grass, Bug (x0.5); no effect on Flying (x0)
+- Flying: strong against Grass, Fighting, Bug (x2); weak against Electric, Rock, Steel (x0.5)
+- Psychic: strong against Fighting, Poison (x2); weak against Psychic, Steel (x0.5); no effect on Dark (x0)
+- Bug: strong against Grass, Psychic, Dark (x2); weak against Fire, Fighting, Poison, Flying, Ghost, Steel, Fairy (x0.5)
+- Rock: strong against Fire, Ice, Flying, Bug (x2); weak against Fighting, Ground, Steel (x0.5)
+- Ghost: strong against Psychic, Ghost (x2); weak against Dark (x0.5); no effect on Normal (x0)
+- Dragon: strong against Dragon (x2); weak against Steel (x0.5); no effect on Fairy (x0)
+- Dark: strong against Psychic, Ghost (x2); weak against Fighting, Dark, Fairy (x0.5)
+- Steel: strong against Ice, Rock, Fairy (x2); weak against Fire, Water, Electric, Steel (x0.5)
+- Fairy: strong against Fighting, Dragon, Dark (x2); weak against Fire, Poison, Steel (x0.5)
+
+Always provide a clear winner and detailed reasoning.
+"""
+
+# Static system prompt marked for Anthropic prompt caching so the ~2KB type
+# chart is not re-processed on every step of the tool loop
+_EXPERT_SYSTEM_MESSAGE = SystemMessage(
+    content=[{
+        "type": "text",
+        "text": _EXPERT_SYSTEM,
+        "cache_control": {"type": "ephemeral"},
+    }]
+)
+
+
 class PokemonExpertAgent:
     """
     Agent that analyzes Pokémon battles and predicts winners based on stats and type matchups.
     Uses LangGraph for structured reasoning.
     """
     
-    def __init__(self, 
-        model: Optional[str] = "claude-3-5-haiku-20241022"
+    def __init__(self,
+        model: Optional[str] = DEFAULT_MODEL,
+        llm: Optional[ChatAnthropic] = None
     ):
         """Initialize the Pokémon Expert Agent with tools and a model."""
-        self.llm = ChatAnthropic(
-            model=model,
-            api_key=ANTHROPIC_API_KEY
-        )
-        
+        self.llm = llm or get_chat_model(model)
+
         # Define tools the expert can use
         self.tools = [
             get_type_effectiveness,
@@ -226,47 +383,17 @@ class PokemonExpertAgent:
             compare_pokemon_data
         ]
         
-        # System message that provides context about the agent's purpose
-        system_message = """
-        You are a Pokémon Battle Expert with extensive knowledge of Pokémon battles, type matchups, and competitive strategy.
-        
-        When analyzing battles between two Pokémon:
-        1. Consider their types and type effectiveness (which types are strong/weak against others)
-        2. Analyze their base stats (speed is often crucial in determining who attacks first)
-        3. Consider their typical movesets and abilities
-        4. Provide a clear prediction with detailed reasoning
-        
-        Type effectiveness chart (multipliers for attacking types against defending types):
-        - Normal: weak to Fighting (x2); immune to Ghost (x0)
-        - Fire: strong against Grass, Ice, Bug, Steel (x2); weak against Water, Rock, Fire, Dragon (x0.5)
-        - Water: strong against Fire, Ground, Rock (x2); weak against Water, Grass, Dragon (x0.5)
-        - Electric: strong against Water, Flying (x2); weak against Electric, Grass, Dragon (x0.5); no effect on Ground (x0)
-        - Grass: strong against Water, Ground, Rock (x2); weak against Fire, Grass, Poison, Flying, Bug, Dragon, Steel (x0.5)
-        - Ice: strong against Grass, Ground, Flying, Dragon (x2); weak against Fire, Water, Ice, Steel (x0.5)
-        - Fighting: strong against Normal, Ice, Rock, Dark, Steel (x2); weak against Poison, Flying, Psychic, Bug, Fairy (x0.5); no effect on Ghost (x0)
-        - Poison: strong against Grass, Fairy (x2); weak against Poison, Ground, Rock, Ghost (x0.5); no effect on Steel (x0)
-        - Ground: strong against Fire, Electric, Poison, Rock, Steel (x2); weak against Grass, Bug (x0.5); no effect on Flying (x0)
-        - Flying: strong against Grass, Fighting, Bug (x2); weak against Electric, Rock, Steel (x0.5)
-        - Psychic: strong against Fighting, Poison (x2); weak against Psychic, Steel (x0.5); no effect on Dark (x0)
-        - Bug: strong against Grass, Psychic, Dark (x2); weak against Fire, Fighting, Poison, Flying, Ghost, Steel, Fairy (x0.5)
-        - Rock: strong against Fire, Ice, Flying, Bug (x2); weak against Fighting, Ground, Steel (x0.5)
-        - Ghost: strong against Psychic, Ghost (x2); weak against Dark (x0.5); no effect on Normal (x0)
-        - Dragon: strong against Dragon (x2); weak against Steel (x0.5); no effect on Fairy (x0)
-        - Dark: strong against Psychic, Ghost (x2); weak against Fighting, Dark, Fairy (x0.5)
-        - Steel: strong against Ice, Rock, Fairy (x2); weak against Fire, Water, Electric, Steel (x0.5)
-        - Fairy: strong against Fighting, Dragon, Dark (x2); weak against Fire, Poison, Steel (x0.5)
-        
-        Always provide a clear winner and detailed reasoning.
-        """
-        
         # Create the agent executor
         self.agent_executor = create_react_agent(
             self.llm,
             self.tools,
-            state_modifier=system_message,
+            state_modifier=_EXPERT_SYSTEM_MESSAGE,
             name="Pokemon Expert"
         )
 
+        # Cache of battle results keyed on the unordered Pokémon pair
+        self._winner_cache: Dict[frozenset, Dict[str, str]] = {}
+
     def determine_winner(self, pokemon1: str, pokemon2: str) -> Dict[str, str]:
         """
         Determine the winner between two Pokémon and provide reasoning.
@@ -278,36 +405,125 @@ class PokemonExpertAgent:
         Returns:
             Dictionary with winner and reasoning
         """
+        # Reuse a previous prediction for the same matchup, regardless of order
+        cache_key = frozenset({pokemon1.lower(), pokemon2.lower()})
+        cached = self._winner_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Warm the fetch cache for both combatants concurrently, so the
+        # tool calls inside the agent loop hit cache instead of issuing
+        # two sequential PokeAPI round-trips
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            executor.map(fetch_pokemon_data, (pokemon1, pokemon2))
+
         # Format the query message
         query = f"Who would win in a battle between {pokemon1} and {pokemon2}? Analyze their types, stats, and abilities to determine a winner. Provide detailed reasoning."
         
-        # Initialize the agent with the query
-        response = self.agent_executor.invoke({"messages": [HumanMessage(content=query)]})
-        
-        # Extract the final answer
-        final_answer = response["messages"][-1].content
+        # Stream the agent step-by-step so the loop can stop as soon as a
+        # clear verdict naming one of the combatants has been produced
+        verdict_re = _verdict_re(pokemon1, pokemon2)
+        final_answer = ""
+        for step in self.agent_executor.stream(
+            {"messages": [HumanMessage(content=query)]}, stream_mode="values"
+        ):
+            content = _ai_answer(step["messages"][-1])
+            if content:
+                final_answer = content
+                if verdict_re.search(final_answer):
+                    break
         
         # Use structured output with the BattleAnalysisResult model to extract winner and reasoning
-        prompt = f"""
-        Based on the following battle analysis between {pokemon1} and {pokemon2}, determine the winner and provide the reasoning.
-        
-        Battle Analysis:
-        {final_answer}
-        
-        Identify which Pokémon would win the battle and explain why.
-        """
-        
+        prompt = _EXTRACT_PROMPT.format(
+            pokemon1=pokemon1, pokemon2=pokemon2, analysis=final_answer
+        )
+
+
         try:
             # Use structured output to extract the winner and reasoning
             structured_llm = self.llm.with_structured_output(BattleAnalysisResult)
             result = structured_llm.invoke(prompt)
-            
-            return {
+
+            battle_result = {
                 "winner": result.winner,
                 "reasoning": result.reasoning
             }
-        except Exception:            
-            return {
-                "winner": "Unable to determine a clear winner",
-                "reasoning": ""
+            # Only successful analyses are cached, so transient failures retry
+            self._winner_cache[cache_key] = battle_result
+            return battle_result
+        except Exception:
+            return self._fallback_verdict(pokemon1, pokemon2, final_answer)
+
+    async def adetermine_winner(self, pokemon1: str, pokemon2: str) -> Dict[str, str]:
+        """
+        Async counterpart of determine_winner for callers on an event loop.
+
+        Streams the agent and extracts the verdict without blocking, so a
+        server can overlap several battle analyses on one loop.
+        """
+        cache_key = frozenset({pokemon1.lower(), pokemon2.lower()})
+        cached = self._winner_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Warm the fetch cache for both combatants concurrently, so the
+        # tool calls inside the agent loop hit cache instead of issuing
+        # two sequential PokeAPI round-trips
+        await asyncio.gather(
+            asyncio.to_thread(fetch_pokemon_data, pokemon1),
+            asyncio.to_thread(fetch_pokemon_data, pokemon2),
+        )
+
+        query = f"Who would win in a battle between {pokemon1} and {pokemon2}? Analyze their types, stats, and abilities to determine a winner. Provide detailed reasoning."
+
+        verdict_re = _verdict_re(pokemon1, pokemon2)
+        final_answer = ""
+        # Bound concurrent LLM work so a burst of battles doesn't queue
+        # behind the provider's rate limit
+        async with get_llm_semaphore():
+            async for step in self.agent_executor.astream(
+                {"messages": [HumanMessage(content=query)]}, stream_mode="values"
+            ):
+                content = _ai_answer(step["messages"][-1])
+                if content:
+                    final_answer = content
+                    if verdict_re.search(final_answer):
+                        break
+
+        prompt = _EXTRACT_PROMPT.format(
+            pokemon1=pokemon1, pokemon2=pokemon2, analysis=final_answer
+        )
+
+        try:
+            structured_llm = self.llm.with_structured_output(BattleAnalysisResult)
+            async with get_llm_semaphore():
+                result = await structured_llm.ainvoke(prompt)
+
+            battle_result = {
+                "winner": result.winner,
+                "reasoning": result.reasoning
             }
+            self._winner_cache[cache_key] = battle_result
+            return battle_result
+        except Exception:
+            return self._fallback_verdict(pokemon1, pokemon2, final_answer)
+
+    @staticmethod
+    def _fallback_verdict(pokemon1: str, pokemon2: str, final_answer: Any) -> Dict[str, str]:
+        """
+        Salvage a verdict from the free-form analysis with one lowercased
+        pass: a win declaration naming exactly one Pokémon.
+        """
+        answer_l = final_answer.lower() if isinstance(final_answer, str) else ""
+        if _WIN_RE.search(answer_l):
+            mentioned = _mentioned_pokemon([pokemon1, pokemon2], answer_l)
+            if len(mentioned) == 1:
+                return {
+                    "winner": mentioned[0].capitalize(),
+                    "reasoning": final_answer
+                }
+
+        return {
+            "winner": "Unable to determine a clear winner",
+            "reasoning": ""
+        }
@@ -1,16 +1,32 @@
-import requests
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
 
-from langchain_core.tools import tool
+import httpx
+import orjson
+import requests
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter, Retry
+from pydantic import BaseModel, ConfigDict, Field
+
 from langchain_anthropic import ChatAnthropic
+from langchain_core.tools import tool
 from langgraph.prebuilt import create_react_agent
 from langchain_core.messages import HumanMessage
 
-from pokemon.core.config import ANTHROPIC_API_KEY
+from pokemon.core.config import (
+    DEFAULT_MODEL,
+    POKEAPI_CACHE_SIZE,
+    POKEAPI_CACHE_TTL,
+    get_chat_model,
+    get_http_client,
+)
 
 class PokemonInfo(BaseModel):
     """Information about a Pokemon"""
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     name: str = Field(description="Name of the Pokemon")
     id: int = Field(description="Pokemon ID number")
     types: List[str] = Field(description="Types of the Pokemon")
@@ -20,43 +36,124 @@ class PokemonInfo(BaseModel):
     abilities: List[str] = Field(description="Abilities of the Pokemon")
 
 
-@tool
-def get_pokemon_data(pokemon_name: str) -> Dict[str, Any]:
+BASE_URL = "https://pokeapi.co/api/v2/pokemon/"
+
+# Pooled session so PokeAPI fetches reuse one keep-alive connection instead
+# of paying a TCP+TLS handshake per call; transient errors retry with backoff
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept-Encoding": "gzip", "User-Agent": "pokemon-ai/1.0"})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504]),
+))
+
+
+# Parsed Pokemon data keyed on the normalized name. PokeAPI data is
+# effectively static, so entries live for a day by default (tunable via
+# POKEAPI_CACHE_TTL/POKEAPI_CACHE_SIZE); the lock keeps the cache safe
+# across server threads, and the sync and async fetch paths share it.
+_POKEMON_CACHE: TTLCache = TTLCache(maxsize=POKEAPI_CACHE_SIZE, ttl=POKEAPI_CACHE_TTL)
+_POKEMON_CACHE_LOCK = threading.Lock()
+
+
+def _fetch_pokemon(pokemon_name: str) -> Dict[str, Any]:
     """
-    Retrieve detailed information about a specific Pokemon by name or ID.
-    
+    Fetch and parse a Pokemon from the PokeAPI, caching the parsed result.
+
+    The cache is keyed on the normalized (lowercase, stripped) name, so repeat
+    lookups for the same Pokemon skip the network round-trip entirely.
+
     Args:
-        pokemon_name: The name or ID of the Pokemon to look up (case-insensitive).
-        
+        pokemon_name: Normalized name or ID of the Pokemon.
+
     Returns:
         A dictionary containing the Pokemon's data.
     """
-    BASE_URL = "https://pokeapi.co/api/v2/pokemon/"
+    with _POKEMON_CACHE_LOCK:
+        cached = _POKEMON_CACHE.get(pokemon_name)
+    if cached is not None:
+        return cached
+
+    response = _SESSION.get(f"{BASE_URL}{pokemon_name}", timeout=10)
+    response.raise_for_status()
+
+    parsed = _parse_pokemon(orjson.loads(response.content))
+    with _POKEMON_CACHE_LOCK:
+        _POKEMON_CACHE[pokemon_name] = parsed
+    return parsed
+
+
+def _parse_pokemon(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract and format the relevant fields from a raw PokeAPI response."""
+    return {
+        "name": data["name"].capitalize(),
+        "id": data["id"],
+        "types": [t["type"]["name"].capitalize() for t in data["types"]],
+        "stats": {
+            stat["stat"]["name"].replace("-", "_"): stat["base_stat"]
+            for stat in data["stats"]
+        },
+        "height": data["height"],
+        "weight": data["weight"],
+        "abilities": [ability["ability"]["name"].replace("-", " ").capitalize()
+                    for ability in data["abilities"]]
+    }
+
+
+async def _afetch_pokemon(pokemon_name: str, client: httpx.AsyncClient) -> Dict[str, Any]:
+    """Async counterpart of _fetch_pokemon, sharing its cache through httpx."""
+    with _POKEMON_CACHE_LOCK:
+        cached = _POKEMON_CACHE.get(pokemon_name)
+    if cached is not None:
+        return cached
+
+    response = await client.get(f"{BASE_URL}{pokemon_name}")
+    response.raise_for_status()
+
+    parsed = _parse_pokemon(orjson.loads(response.content))
+    with _POKEMON_CACHE_LOCK:
+        _POKEMON_CACHE[pokemon_name] = parsed
+    return parsed
+
+
+async def aget_pokemon_data(pokemon_names: List[str]) -> List[Any]:
+    """
+    Fetch data for several Pokemon concurrently over one pooled connection.
+
+    Args:
+        pokemon_names: Names or IDs of the Pokemon to look up (case-insensitive).
+
+    Returns:
+        A list with one entry per name: the Pokemon's data dict, or an error
+        message string for names that could not be fetched.
+    """
+    client = get_http_client()
+    results = await asyncio.gather(
+        *[_afetch_pokemon(name.lower().strip(), client) for name in pokemon_names],
+        return_exceptions=True
+    )
+
+    formatted = []
+    for name, result in zip(pokemon_names, results):
+        if isinstance(result, httpx.HTTPStatusError) and result.response.status_code == 404:
+            formatted.append(f"Pokemon '{name}' not found. Please check the spelling.")
+        elif isinstance(result, Exception):
+            formatted.append(f"Error fetching Pokemon data: {str(result)}")
+        else:
+            formatted.append(result)
+
+    return formatted
+
+
+def fetch_pokemon_data(pokemon_name: str) -> Any:
+    """Plain-function version of the get_pokemon_data tool for internal callers."""
     try:
         # Normalize input to lowercase for consistent API calls
         pokemon_name = pokemon_name.lower().strip()
-        response = requests.get(f"{BASE_URL}{pokemon_name}")
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Extract and format the relevant information
-        pokemon_info = {
-            "name": data["name"].capitalize(),
-            "id": data["id"],
-            "types": [t["type"]["name"].capitalize() for t in data["types"]],
-            "stats": {
-                stat["stat"]["name"].replace("-", "_"): stat["base_stat"] 
-                for stat in data["stats"]
-            },
-            "height": data["height"],
-            "weight": data["weight"],
-            "abilities": [ability["ability"]["name"].replace("-", " ").capitalize() 
-                        for ability in data["abilities"]]
-        }
-        
-        return pokemon_info
-        
+        return _fetch_pokemon(pokemon_name)
+
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
             return f"Pokemon '{pokemon_name}' not found. Please check the spelling."
@@ -65,6 +162,20 @@ def get_pokemon_data(pokemon_name: str) -> Dict[str, Any]:
         return f"An unexpected error occurred: {str(e)}"
 
 
+@tool
+def get_pokemon_data(pokemon_name: str) -> Dict[str, Any]:
+    """
+    Retrieve detailed information about a specific Pokemon by name or ID.
+
+    Args:
+        pokemon_name: The name or ID of the Pokemon to look up (case-insensitive).
+
+    Returns:
+        A dictionary containing the Pokemon's data.
+    """
+    return fetch_pokemon_data(pokemon_name)
+
+
 @tool
 def compare_pokemon(pokemon_names: List[str]) -> Dict[str, Any]:
     """
@@ -77,24 +188,33 @@ def compare_pokemon(pokemon_names: List[str]) -> Dict[str, Any]:
         A dictionary containing comparable data for all specified Pokemon.
     """
     results = {}
-    
-    for name in pokemon_names:
-        pokemon_data = get_pokemon_data.invoke(name)
+
+    # Nothing to fetch; an executor with zero workers would raise
+    if not pokemon_names:
+        return results
+
+    # Fetch all Pokemon concurrently; each lookup is an independent network
+    # call, and the plain fetch function skips tool-invocation overhead
+    with ThreadPoolExecutor(max_workers=min(len(pokemon_names), 8)) as executor:
+        fetched = executor.map(fetch_pokemon_data, pokemon_names)
+
+    for name, pokemon_data in zip(pokemon_names, fetched):
         if isinstance(pokemon_data, dict):
             results[pokemon_data["name"]] = pokemon_data
         else:
             results[name] = {"error": pokemon_data}
-            
+
     return results
 
 
 class ResearcherAgent:
-    def __init__(self, model: Optional[str] = "claude-3-5-haiku-20241022"):
+    def __init__(
+        self,
+        model: Optional[str] = DEFAULT_MODEL,
+        llm: Optional[ChatAnthropic] = None
+    ):
         """Initialize the researcher agent with tools for interacting with the PokéAPI."""
-        self.llm = ChatAnthropic(
-            model=model,
-            api_key=ANTHROPIC_API_KEY
-        )
+        self.llm = llm or get_chat_model(model)
         self.tools = [
             get_pokemon_data,
             compare_pokemon
@@ -116,6 +236,14 @@ class ResearcherAgent:
             name="Researcher Agent"
         )
     
+    def get_pokemon_data(self, pokemon_name: str) -> Any:
+        """Fetch one Pokemon's data for internal callers, bypassing tool dispatch."""
+        return fetch_pokemon_data(pokemon_name)
+
+    async def aget_pokemon_data(self, pokemon_names: List[str]) -> List[Any]:
+        """Fetch several Pokemon concurrently for internal callers."""
+        return await aget_pokemon_data(pokemon_names)
+
     def query(self, question: str) -> Dict[str, Any]:
         """
         Process a query about Pokemon by leveraging the agent to retrieve and format information.
@@ -131,12 +259,22 @@ class ResearcherAgent:
         
         # Invoke the agent
         result = self.agent_executor.invoke({"messages": messages})
-        
+
         # Extract the last AI message for the response
         final_answer = result["messages"][-1].content
-        
+
         return {
             "answer": final_answer,
         }
 
+    async def aquery(self, question: str) -> Dict[str, Any]:
+        """Async counterpart of query, so callers on an event loop don't block."""
+        messages = [HumanMessage(content=question)]
+
+        result = await self.agent_executor.ainvoke({"messages": messages})
+
+        return {
+            "answer": result["messages"][-1].content,
+        }
+
 
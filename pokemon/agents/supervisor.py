@@ -1,24 +1,255 @@
-from typing import Dict, List, Any, Optional, TypedDict, Literal
+import asyncio
 import re
+import threading
+from typing import Dict, List, Any, Optional, TypedDict, Literal
+
+from cachetools import TTLCache
 
 from langchain_core.messages import HumanMessage
-from langchain_anthropic import ChatAnthropic
-from langchain_core.tools import tool
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import create_react_agent
+from langchain_anthropic import ChatAnthropic
+from pydantic import BaseModel, Field
+
+from pokemon.agents.researcher import fetch_pokemon_data
+from pokemon.core.config import DEFAULT_MODEL, get_chat_model, get_llm_semaphore
+
+
+class QuestionClassification(BaseModel):
+    """Classification of a Pokemon-related question."""
+    question_type: Literal["general_knowledge", "pokemon_research", "pokemon_data", "battle_analysis"] = Field(
+        ...,
+        description="The type of question being asked")
+    pokemon_names: List[str] = Field(
+        default_factory=list,
+        description="Names of Pokemon mentioned in battle questions (2+ for battles)")
+    pokemon_name: str = Field(
+        default="",
+        description="Name of the Pokemon for data questions (single Pokemon)")
+    confidence: float = Field(
+        default=1.0,
+        description="Confidence in the classification (0.0 to 1.0)")
+
+
+# Classification patterns, compiled once at import so the per-request hot
+# path only pays for the match itself. All patterns carry re.IGNORECASE so
+# callers never need to allocate a lowercased copy of the question.
+# Keyword patterns tagged by category; extending a category is a data
+# change, not a regex edit. The table compiles into the single-pass
+# alternation below, giving one flashtext-style categorized scan without
+# an extra dependency.
+_CATEGORY_KEYWORDS = {
+    "battle": (
+        r"battle", r"fight", r"stronger", r"weaker", r"effective",
+        r"advantage", r"beats?",
+        r"\w+\s+(?:vs\.?|versus)\s+\w+",
+        r"(?:who|which)\s+(?:\w+\s+)?w(?:ould|ill)\s+win",
+    ),
+    "data": (
+        r"\w+'s\s+(?:base\s+)?(?:stats?|abilit(?:y|ies)|types?|height|weight)",
+        r"(?:stats?|abilit(?:y|ies)|types?|height|weight)\s+(?:of|for)\s+\w+",
+    ),
+    "pokemon": (
+        r"pokemon", r"pokedex", r"base\s+stats", r"abilit(?:y|ies)",
+        r"types?", r"moves?", r"evolutions?", r"height", r"weight",
+    ),
+}
+
+_CATEGORY_RE = re.compile(
+    r"\b(?:" + "|".join(
+        f"(?P<{category}>" + "|".join(patterns) + ")"
+        for category, patterns in _CATEGORY_KEYWORDS.items()
+    ) + r")\b",
+    re.IGNORECASE)
+
+_ALL_CATEGORIES = frozenset(("battle", "data", "pokemon"))
+
+# Scans are bounded to this many characters so adversarially long input
+# can't make the alternation patterns churn over megabytes of text
+_MAX_SCAN_LEN = 512
+
+# Cheap token prefilter: a question whose word set is disjoint from these
+# cannot match any category pattern, and one tokenize plus O(1) frozenset
+# membership rejects it cheaper than a full regex scan
+_HINT_TOKENS = frozenset((
+    "pokemon", "pokedex", "stat", "stats", "ability", "abilities", "type",
+    "types", "move", "moves", "evolution", "evolutions", "height", "weight",
+    "battle", "fight", "win", "beat", "beats", "defeat", "vs", "versus",
+    "stronger", "weaker", "effective", "advantage",
+))
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+
+def _scan_categories(question: str) -> frozenset:
+    """
+    Scan the question once and report which classification categories match.
+
+    One linear pass over the combined alternation replaces an independent
+    full-string search per category; the named group of each hit tells us
+    which category fired.
+    """
+    question = question[:_MAX_SCAN_LEN]
+    if _HINT_TOKENS.isdisjoint(_TOKEN_RE.findall(question.lower())):
+        return frozenset()
+
+    found = set()
+    for match in _CATEGORY_RE.finditer(question):
+        found.add(match.lastgroup)
+        if len(found) == len(_ALL_CATEGORIES):
+            break
+    return frozenset(found)
+
+# Name-extraction patterns for the two routed question shapes. The battle
+# shapes are fused into one named-group alternation so a single scan finds
+# whichever shape matches first instead of one full pass per pattern.
+_NAMES_RE = re.compile(
+    r"\b(?:(?P<a1>\w+)\s+(?:vs\.?|versus|against)\s+(?P<b1>\w+)"
+    r"|between\s+(?P<a2>\w+)\s+and\s+(?P<b2>\w+)"
+    r"|(?:would|will|could|can)\s+(?P<a3>\w+)\s+(?:beat|defeat)\s+(?P<b3>\w+))\b",
+    re.IGNORECASE)
+_NAME_GROUP_PAIRS = (("a1", "b1"), ("a2", "b2"), ("a3", "b3"))
+_DATA_NAME_RE = re.compile(
+    r"\b(?:(?P<pos>\w+)'s\s+(?:base\s+)?(?:stats?|abilit(?:y|ies)|types?|height|weight)"
+    r"|(?:stats?|abilit(?:y|ies)|types?|height|weight)\s+(?:of|for)\s+(?P<of>\w+))\b",
+    re.IGNORECASE)
+
+# Last-resort name extraction: capitalized words that aren't ordinary
+# question vocabulary are likely Pokemon names
+_CAPITALIZED_RE = re.compile(r"\b([A-Z][a-z]+)\b")
+_NAME_STOPWORDS = frozenset((
+    "what", "which", "who", "whose", "would", "will", "could", "can",
+    "does", "do", "is", "are", "the", "tell", "how", "between", "and",
+    "versus", "about", "pokemon", "in", "if",
+))
+
+
+def _normalize_question(question: str) -> str:
+    """Collapse whitespace and lowercase a question for use as a cache key."""
+    return re.sub(r"\s+", " ", question.strip().lower())
+
+
+def _capitalized_names(question: str) -> List[str]:
+    """Capitalized words that look like Pokemon names, stopwords excluded."""
+    return [word.lower() for word in _CAPITALIZED_RE.findall(question[:_MAX_SCAN_LEN])
+            if word.lower() not in _NAME_STOPWORDS]
+
+
+def _is_trivial_question(question: str) -> bool:
+    """Check whether a question needs no routing at all: no domain
+    vocabulary and no candidate Pokemon names, so a single LLM call
+    answers it."""
+    return not _scan_categories(question) and not _capitalized_names(question)
+
+
+def _is_pokemon_question(question: str) -> bool:
+    """Check whether the question mentions Pokemon-domain vocabulary."""
+    return bool(_scan_categories(question) & {"pokemon", "data"})
+
+
+def _is_battle_question(question: str) -> bool:
+    """Check whether the question asks about a battle between Pokemon."""
+    return "battle" in _scan_categories(question)
+
+
+def _is_data_question(question: str) -> bool:
+    """Check whether the question asks for a specific Pokemon's data."""
+    return "data" in _scan_categories(question)
+
+
+def _extract_pokemon_names(question: str) -> List[str]:
+    """Extract the two combatant names from a battle question, if present."""
+    question = question[:_MAX_SCAN_LEN]
+    match = _NAMES_RE.search(question)
+    if match:
+        for first, second in _NAME_GROUP_PAIRS:
+            if match.group(first):
+                return [match.group(first).lower(), match.group(second).lower()]
+
+    # Fall back to capitalized words when no battle shape matched
+    names = _capitalized_names(question)
+    if len(names) >= 2:
+        return names[:2]
+    return []
+
+
+def _extract_pokemon_name(question: str) -> str:
+    """Extract the subject name from a data question, or '' if none found."""
+    question = question[:_MAX_SCAN_LEN]
+    match = _DATA_NAME_RE.search(question)
+    if match:
+        return (match.group("pos") or match.group("of")).lower()
+
+    # Fall back to a lone capitalized word when no data shape matched
+    names = _capitalized_names(question)
+    if len(names) == 1:
+        return names[0]
+    return ""
+
+
+# Prompt for the structured-output classification fallback, written
+# flush-left at module scope so no indentation whitespace is tokenized
+# on every LLM call
+_CLASSIFY_PROMPT = """\
+Classify this Pokemon-related question into one of these categories:
+1. "general_knowledge" - General questions that don't need special Pokemon data
+2. "pokemon_research" - Questions about Pokemon that need research but not specific data lookup
+3. "pokemon_data" - Questions about specific Pokemon's stats, abilities, etc. (extract the Pokemon name)
+4. "battle_analysis" - Questions about which Pokemon would win in a battle (extract both Pokemon names)
+
+Question: {question}"""
+
+
+# Shared default subagents: every supervisor in the process reuses one
+# researcher/expert per model, so their HTTP connection pools and agent
+# executors are built once instead of per supervisor
+_default_agents: Dict[str, Any] = {}
+
+
+def _default_researcher(model: str) -> 'ResearcherAgent':  # type: ignore
+    """Return the process-wide default ResearcherAgent for this model."""
+    # Imported at call time so the class is resolved when first needed
+    from pokemon.agents.researcher import ResearcherAgent
+    key = f"researcher:{model}"
+    if key not in _default_agents:
+        _default_agents[key] = ResearcherAgent(model=model)
+    return _default_agents[key]
 
-from pokemon.core.config import ANTHROPIC_API_KEY
+
+def _default_expert(model: str) -> 'PokemonExpertAgent':  # type: ignore
+    """Return the process-wide default PokemonExpertAgent for this model."""
+    from pokemon.agents.pokemon_expert import PokemonExpertAgent
+    key = f"expert:{model}"
+    if key not in _default_agents:
+        _default_agents[key] = PokemonExpertAgent(model=model)
+    return _default_agents[key]
+
+
+# Strong references to fire-and-forget warmup tasks; the event loop
+# only holds weak references, so unreferenced tasks can be collected
+# before they run
+_background_tasks: set = set()
+
+# The graph is two steps deep (classify, then one handler), so a small
+# recursion limit is plenty and fails fast if a routing bug ever loops
+_GRAPH_CONFIG = {"recursion_limit": 8}
+
+# Route strings map one-to-one onto node names, so edge resolution is a
+# single identity-dict lookup per transition
+_ROUTES = {step: step for step in (
+    "direct_answer", "pokemon_research", "pokemon_data", "battle_analysis")}
 
 
 class AgentState(TypedDict):
-    """Represents the state of the agent workflow."""
-    messages: List[Any]  # Human and AI messages
+    """Represents the state of the agent workflow.
+
+    Kept to the fields the nodes actually read; every key here is copied
+    and propagated by LangGraph on each transition, so the state stays
+    lean on purpose.
+    """
     question: str  # Original user question
     next_step: Optional[str]  # Next step to take (if any)
-    pokemon_data: Optional[Dict[str, Any]]  # Data from researcher
     pokemon_names: Optional[List[str]]
     pokemon_name: Optional[str]
-    battle_result: Optional[Dict[str, str]]  # Battle result from expert
     final_answer: Optional[Dict[str, Any]]  # Final answer to return to user
 
 
@@ -36,46 +267,65 @@ class SupervisorAgent:
         self, 
         researcher_agent: Optional['ResearcherAgent'] = None, # type: ignore
         expert_agent: Optional['PokemonExpertAgent'] = None, # type: ignore
-        model: Optional[str] = "claude-3-5-haiku-20241022"
+        model: Optional[str] = DEFAULT_MODEL,
+        llm: Optional[ChatAnthropic] = None,
+        use_llm_classifier: bool = True,
+        speculative: bool = True
     ):
-        from pokemon.agents.researcher import ResearcherAgent
-        from pokemon.agents.pokemon_expert import PokemonExpertAgent
+        """Initialize the Supervisor Agent with specialized agents and tools."""
+        # One chat client serves the supervisor and both default subagents
+        # (get_chat_model hands every agent the same per-model instance)
+        self.llm = llm or get_chat_model(model)
+        self.researcher = researcher_agent or _default_researcher(model)
+        self.expert = expert_agent or _default_expert(model)
 
+        # When disabled, ambiguous questions route on regex signals alone
+        # instead of falling back to the structured-output LLM call
+        self.use_llm_classifier = use_llm_classifier
+
+        # Bind the structured-output router once; with_structured_output
+        # builds a new runnable (schema conversion included) on every call
+        self._router = self.llm.with_structured_output(QuestionClassification)
+
+        # When disabled, aprocess_question runs the graph without the
+        # speculative direct-answer/research fan-out (useful when debugging)
+        self.speculative = speculative
+
+
+        # The workflow graph is compiled lazily on first use; supervisors
+        # whose questions are all served by the caches or the speculative
+        # direct path never pay the graph-building cost
+        self._workflow = None
+
+        # Classification results keyed on the whitespace-normalized question,
+        # so repeated or re-phrased-only-in-spacing questions skip both the
+        # regex pass and the LLM classification call. Bounded like the
+        # answer cache: the keys are arbitrary user input. TTLCache
+        # mutates internal bookkeeping even on reads, so the lock guards
+        # it against the to_thread workers running classification.
+        self._classification_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+        self._classification_lock = threading.Lock()
+
+        # Pokemon data keyed on lowercased name; the data is effectively
+        # static, so repeat lookups skip the researcher entirely
+        self._pokemon_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Final answers keyed on the normalized question. Entries expire so
+        # answers don't go stale, and the lock keeps the cache safe under
+        # concurrent FastAPI requests.
+        self._answer_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+        self._answer_lock = threading.Lock()
+
+    def _remember_classification(self, cache_key: str, state: AgentState) -> AgentState:
+        """Record the routing decision for this question and return the state."""
+        with self._classification_lock:
+            self._classification_cache[cache_key] = {
+                "next_step": state["next_step"],
+                "pokemon_names": state.get("pokemon_names"),
+                "pokemon_name": state.get("pokemon_name"),
+            }
+        return state
 
-        """Initialize the Supervisor Agent with specialized agents and tools."""
-        self.researcher = researcher_agent or ResearcherAgent(model=model)
-        self.expert = expert_agent or PokemonExpertAgent(model=model)
-        self.llm = ChatAnthropic(
-            model=model,
-            api_key=ANTHROPIC_API_KEY
-        )
-        
-        # Define tools the supervisor can use
-        self.tools = []
-        
-        # System message for the supervisor agent
-        system_message = """
-        You are a Pokemon Knowledge Supervisor that determines how to best answer user questions.
-        
-        For any question, analyze whether:
-        1. It's a GENERAL knowledge question that you can answer directly
-        2. It requires POKEMON DATA to be fetched from an external API
-        3. It's asking about a POKEMON BATTLE between two Pokemon
-        
-        Be efficient and only use specialized agents when necessary.
-        """
-        
-        # Create the agent executor for classification
-        self.agent_executor = create_react_agent(
-            self.llm,
-            self.tools,
-            state_modifier=system_message,
-            name="Supervisor Agent"
-        )
-        
-        # Create the workflow graph
-        self.workflow = self._create_workflow()
-            
     def _classify_question(self, state: AgentState) -> AgentState:
         """
         Classify the type of question and determine the next step using structured output.
@@ -86,62 +336,86 @@ class SupervisorAgent:
         Returns:
             Updated state with the next_step field set
         """
-        from pydantic import BaseModel, Field
-        
-        # Define a Pydantic model for the structured output
-        class QuestionClassification(BaseModel):
-            """Classification of a Pokemon-related question."""
-            question_type: Literal["general_knowledge", "pokemon_research", "pokemon_data", "battle_analysis"] = Field(
-                ..., 
-                description="The type of question being asked")
-            pokemon_names: List[str] = Field(
-                default_factory=list, 
-                description="Names of Pokemon mentioned in battle questions (2+ for battles)")
-            pokemon_name: str = Field(
-                default="", 
-                description="Name of the Pokemon for data questions (single Pokemon)")
-            confidence: float = Field(
-                default=1.0, 
-                description="Confidence in the classification (0.0 to 1.0)")
-        
         # Get the user's question
         question = state["question"]
-        
-        # Create a prompt for classification
-        prompt = f"""Classify this Pokemon-related question into one of these categories:
-        1. "general_knowledge" - General questions that don't need special Pokemon data
-        2. "pokemon_research" - Questions about Pokemon that need research but not specific data lookup
-        3. "pokemon_data" - Questions about specific Pokemon's stats, abilities, etc. (extract the Pokemon name)
-        4. "battle_analysis" - Questions about which Pokemon would win in a battle (extract both Pokemon names)
-
-        Question: {question}"""
-        
-        try:
-            # Use structured output to classify the question
-            structured_llm = self.llm.with_structured_output(QuestionClassification)
-            result = structured_llm.invoke(prompt)
-            
-            # Set the next step based on the classification
-            if result.question_type == "general_knowledge":
-                state["next_step"] = "direct_answer"
-            else:
-                state["next_step"] = result.question_type
-            
-            # Store relevant Pokemon names
-            if result.question_type == "battle_analysis" and len(result.pokemon_names) >= 2:
-                state["pokemon_names"] = [name.lower() for name in result.pokemon_names]
-            elif result.question_type == "pokemon_data" and result.pokemon_name:
-                state["pokemon_name"] = result.pokemon_name.lower()
-            
-            # If confidence is low, use direct_answer not general_knowledge
-            if result.confidence < 0.5:
-                state["next_step"] = "direct_answer"
-                
-        except Exception as e:
-            state["next_step"] = "general_knowledge"
-        
+
+        # Repeated questions reuse the previous routing decision outright
+        cache_key = _normalize_question(question)
+        with self._classification_lock:
+            cached = self._classification_cache.get(cache_key)
+        if cached is not None:
+            state.update(cached)
+            return state
+
+        # Regex fast path: when the precompiled patterns already decide the
+        # route conclusively, skip the LLM round-trip entirely
+        categories = _scan_categories(question)
+        if "battle" in categories:
+            names = _extract_pokemon_names(question)
+            if len(names) >= 2:
+                state["pokemon_names"] = names
+                state["next_step"] = "battle_analysis"
+                return self._remember_classification(cache_key, state)
+        elif "data" in categories:
+            name = _extract_pokemon_name(question)
+            if name:
+                state["pokemon_name"] = name
+                state["next_step"] = "pokemon_data"
+                return self._remember_classification(cache_key, state)
+        elif not categories and not _capitalized_names(question):
+            # No Pokemon vocabulary and no candidate names anywhere in the
+            # question: general knowledge, no LLM needed to decide that
+            state["next_step"] = "direct_answer"
+            return self._remember_classification(cache_key, state)
+
+        if self.use_llm_classifier:
+            try:
+                # Use structured output to classify the question
+                result = self._router.invoke(_CLASSIFY_PROMPT.format(question=question))
+
+                # Set the next step based on the classification
+                if result.question_type == "general_knowledge":
+                    state["next_step"] = "direct_answer"
+                else:
+                    state["next_step"] = result.question_type
+
+                # Store relevant Pokemon names
+                if result.question_type == "battle_analysis" and len(result.pokemon_names) >= 2:
+                    state["pokemon_names"] = [name.lower() for name in result.pokemon_names]
+                elif result.question_type == "pokemon_data" and result.pokemon_name:
+                    state["pokemon_name"] = result.pokemon_name.lower()
+
+                # If confidence is low, use direct_answer not general_knowledge
+                if result.confidence < 0.5:
+                    state["next_step"] = "direct_answer"
+
+                return self._remember_classification(cache_key, state)
+            except Exception:
+                pass
+
+        # LLM disabled or unavailable: route on the regex signals alone
+        names = _extract_pokemon_names(question)
+        name = _extract_pokemon_name(question)
+        if "battle" in categories and len(names) >= 2:
+            state["pokemon_names"] = names
+            state["next_step"] = "battle_analysis"
+        elif "data" in categories and name:
+            state["pokemon_name"] = name
+            state["next_step"] = "pokemon_data"
+        elif categories:
+            state["next_step"] = "pokemon_research"
+        else:
+            state["next_step"] = "direct_answer"
+
         return state
-    
+
+    @property
+    def workflow(self):
+        """The compiled workflow graph, built once on first access."""
+        if self._workflow is None:
+            self._workflow = self._create_workflow()
+        return self._workflow
+
     def _direct_answer(self, state: AgentState) -> AgentState:
         """
         Answer a general knowledge question directly.
@@ -152,12 +426,9 @@ class SupervisorAgent:
         Returns:
             Updated state with the answer
         """
-        # Get the user's question
-        question = state["question"]
-        
         # Call the LLM to answer the question
-        response = self.llm.invoke([HumanMessage(content=question)])
-        
+        response = self.llm.invoke([HumanMessage(content=state["question"])])
+
         # Extract the answer
         answer = response.content
         
@@ -181,9 +452,8 @@ class SupervisorAgent:
         
         # Call the researcher agent to get the answer
         result = self.researcher.query(question)
-        
+
         # Store the result in the state
-        state["pokemon_data"] = result
         state["final_answer"] = result
         
         return state
@@ -206,14 +476,16 @@ class SupervisorAgent:
             state = self._pokemon_research(state)
             return state
         
-        # Get the Pokemon data
-        from pokemon.agents.researcher import get_pokemon_data
-        pokemon_data = get_pokemon_data.invoke(pokemon_name)
-        
+        # Reuse previously fetched data for this name when we have it
+        pokemon_data = self._pokemon_cache.get(pokemon_name)
+        if pokemon_data is None:
+            # Get the Pokemon data, bypassing tool dispatch for this internal call
+            pokemon_data = fetch_pokemon_data(pokemon_name)
+
         # Check if we got a valid response
         if isinstance(pokemon_data, dict):
-            # Store the data in the state
-            state["pokemon_data"] = pokemon_data
+            # Store the data in the state and cache it for repeat questions
+            self._pokemon_cache[pokemon_name] = pokemon_data
             state["final_answer"] = pokemon_data
         else:
             # If we couldn't get the data, use the researcher to answer
@@ -236,32 +508,74 @@ class SupervisorAgent:
                 
         # Get the battle analysis
         battle_result = self.expert.determine_winner(pokemon_names[0], pokemon_names[1])
-        
+
         # Store the result in the state
-        state["battle_result"] = battle_result
         state["final_answer"] = battle_result
         
         return state
-    
-    def _decide_next_step(self, state: AgentState) -> Literal["direct_answer", "pokemon_research", "pokemon_data", "battle_analysis", "END"]:
+
+    async def _abounded_invoke(self, messages: List[Any]) -> Any:
+        """Call the LLM under the process-wide concurrency bound."""
+        async with get_llm_semaphore():
+            return await self.llm.ainvoke(messages)
+
+    async def _aclassify_question(self, state: AgentState) -> AgentState:
+        """Async variant of _classify_question; runs the blocking work off-loop."""
+        return await asyncio.to_thread(self._classify_question, state)
+
+    async def _adirect_answer(self, state: AgentState) -> AgentState:
+        """Async variant of _direct_answer using the non-blocking LLM call."""
+        response = await self._abounded_invoke([HumanMessage(content=state["question"])])
+        state["final_answer"] = {"answer": response.content}
+        return state
+
+    async def _apokemon_research(self, state: AgentState) -> AgentState:
+        """Async variant of _pokemon_research using the researcher's async query."""
+        result = await self.researcher.aquery(state["question"])
+        state["final_answer"] = result
+        return state
+
+    async def _apokemon_data(self, state: AgentState) -> AgentState:
+        """Async variant of _pokemon_data; the blocking fetch runs off-loop."""
+        pokemon_name = state.get("pokemon_name", "")
+        if not pokemon_name:
+            return await self._apokemon_research(state)
+
+        pokemon_data = self._pokemon_cache.get(pokemon_name)
+        if pokemon_data is None:
+            pokemon_data = await asyncio.to_thread(fetch_pokemon_data, pokemon_name)
+
+        if isinstance(pokemon_data, dict):
+            self._pokemon_cache[pokemon_name] = pokemon_data
+            state["final_answer"] = pokemon_data
+            return state
+
+        return await self._apokemon_research(state)
+
+    async def _abattle_analysis(self, state: AgentState) -> AgentState:
+        """Async variant of _battle_analysis using the expert's async verdict."""
+        pokemon_names = state.get("pokemon_names", [])
+
+        battle_result = await self.expert.adetermine_winner(pokemon_names[0], pokemon_names[1])
+
+        state["final_answer"] = battle_result
+
+        return state
+
+    def _decide_next_step(self, state: AgentState) -> Literal["direct_answer", "pokemon_research", "pokemon_data", "battle_analysis"]:
         """
         Decide the next step based on the state.
-        
+
+        classify_question always sets next_step and never a final answer,
+        so the routing decision is a plain field read.
+
         Args:
             state: The current state of the workflow
-            
+
         Returns:
             The name of the next step
         """
-        # If we've already determined the next step, return it
-        next_step = state.get("next_step")
-        
-        # If we have a final answer, we're done
-        if state.get("final_answer"):
-            return "END"
-        
-        # Return the next step
-        return next_step
+        return state["next_step"]
     
     def _create_workflow(self) -> StateGraph:
         """
@@ -273,36 +587,38 @@ class SupervisorAgent:
         # Create the graph
         workflow = StateGraph(AgentState)
         
-        # Add the nodes for each step
-        workflow.add_node("classify_question", self._classify_question)
-        workflow.add_node("direct_answer", self._direct_answer)
-        workflow.add_node("pokemon_research", self._pokemon_research)
-        workflow.add_node("get_pokemon_data", self._pokemon_data)
-        workflow.add_node("battle_analysis", self._battle_analysis)
+        # Add the nodes for each step; each carries both the sync and async
+        # implementation, so invoke blocks as before while ainvoke awaits
+        # the LLM/API calls instead of holding the event loop
+        workflow.add_node("classify_question", RunnableLambda(
+            self._classify_question, afunc=self._aclassify_question))
+        workflow.add_node("direct_answer", RunnableLambda(
+            self._direct_answer, afunc=self._adirect_answer))
+        workflow.add_node("pokemon_research", RunnableLambda(
+            self._pokemon_research, afunc=self._apokemon_research))
+        workflow.add_node("pokemon_data", RunnableLambda(
+            self._pokemon_data, afunc=self._apokemon_data))
+        workflow.add_node("battle_analysis", RunnableLambda(
+            self._battle_analysis, afunc=self._abattle_analysis))
         
         # Set the entry point
         workflow.set_entry_point("classify_question")
         
-        # Add the edges to connect the nodes
+        # Add the edges to connect the nodes; the node names match the
+        # route strings, so the edge map is the shared identity table
         workflow.add_conditional_edges(
             "classify_question",
             self._decide_next_step,
-            {
-                "direct_answer": "direct_answer",
-                "pokemon_research": "pokemon_research",
-                "pokemon_data": "get_pokemon_data",
-                "battle_analysis": "battle_analysis"
-            }
+            _ROUTES
         )
-        
+
         # Connect all output nodes to END
-        workflow.add_edge("direct_answer", END)
-        workflow.add_edge("pokemon_research", END)
-        workflow.add_edge("get_pokemon_data", END)
-        workflow.add_edge("battle_analysis", END)
+        for node in _ROUTES:
+            workflow.add_edge(node, END)
         
-        # Compile the workflow
-        return workflow.compile()
+        # Compile without a checkpointer: requests are stateless and never
+        # resumed, so per-node state snapshots would be pure overhead
+        return workflow.compile(checkpointer=None)
     
     def process_question(self, question: str) -> Dict[str, Any]:
         """
@@ -314,25 +630,137 @@ class SupervisorAgent:
         Returns:
             A dictionary containing the answer and reasoning
         """
+        # Serve repeated questions straight from the answer cache
+        cache_key = _normalize_question(question)
+        with self._answer_lock:
+            cached = self._answer_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Trivial questions skip the graph entirely: routing would add
+        # node transitions and state copies around what is one LLM call
+        if _is_trivial_question(question):
+            response = self.llm.invoke([HumanMessage(content=question)])
+            result = self._format_result({"answer": response.content})
+            with self._answer_lock:
+                self._answer_cache[cache_key] = result
+            return result
+
         # Initialize the state
         initial_state: AgentState = {
-            "messages": [HumanMessage(content=question)],
             "question": question,
             "next_step": None,
-            "pokemon_data": None,
             "pokemon_names": None,
             "pokemon_name": None,
-            "battle_result": None,
             "final_answer": None
         }
-        
+
         # Run the workflow
-        final_state = self.workflow.invoke(initial_state)
-        
-        # Get the final answer
-        result = final_state["final_answer"]
-        
-        # Format the response consistently
+        final_state = self.workflow.invoke(initial_state, config=_GRAPH_CONFIG)
+
+        result = self._format_result(final_state["final_answer"])
+        with self._answer_lock:
+            self._answer_cache[cache_key] = result
+        return result
+
+    async def aprocess_question(self, question: str) -> Dict[str, Any]:
+        """
+        Async counterpart of process_question.
+
+        Runs the workflow with ainvoke so the network-bound LLM and API
+        calls inside the nodes don't block the caller's event loop, letting
+        a server overlap several questions concurrently.
+
+        Args:
+            question: The user's question
+
+        Returns:
+            A dictionary containing the answer and reasoning
+        """
+        cache_key = _normalize_question(question)
+        with self._answer_lock:
+            cached = self._answer_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Same graph bypass as process_question for trivial questions
+        if _is_trivial_question(question):
+            response = await self._abounded_invoke([HumanMessage(content=question)])
+            result = self._format_result({"answer": response.content})
+            with self._answer_lock:
+                self._answer_cache[cache_key] = result
+            return result
+
+        initial_state: AgentState = {
+            "question": question,
+            "next_step": None,
+            "pokemon_names": None,
+            "pokemon_name": None,
+            "final_answer": None
+        }
+
+        if not self.speculative:
+            final_state = await self.workflow.ainvoke(initial_state, config=_GRAPH_CONFIG)
+            result = self._format_result(final_state["final_answer"])
+        else:
+            result = await self._aprocess_speculatively(question, initial_state)
+
+        with self._answer_lock:
+            self._answer_cache[cache_key] = result
+        return result
+
+    async def _aprocess_speculatively(self, question: str, initial_state: AgentState) -> Dict[str, Any]:
+        """
+        Fan out speculative work while classification runs.
+
+        A direct-answer draft always starts immediately, and a researcher
+        query starts too when the prefilter says the question is
+        Pokemon-flavoured; whichever branch classification confirms is
+        then already in flight, and the rest are cancelled.
+        """
+        direct_task = asyncio.create_task(
+            self._abounded_invoke([HumanMessage(content=question)]))
+        research_task = None
+        categories = _scan_categories(question)
+        if "pokemon" in categories:
+            research_task = asyncio.create_task(self.researcher.aquery(question))
+        if "battle" in categories:
+            # Warm the PokeAPI cache for the likely combatants while
+            # classification runs; the expert's own fetches then hit the
+            # cache. Errors surface as strings, so the task never raises.
+            names = _extract_pokemon_names(question)
+            if names:
+                prefetch = asyncio.gather(
+                    *[asyncio.to_thread(fetch_pokemon_data, name) for name in names])
+                # The loop only weak-refs tasks, so keep a strong
+                # reference until the prefetch completes
+                _background_tasks.add(prefetch)
+                prefetch.add_done_callback(_background_tasks.discard)
+
+        classified = await asyncio.to_thread(self._classify_question, initial_state)
+        next_step = classified.get("next_step")
+
+        if next_step == "direct_answer":
+            if research_task is not None:
+                research_task.cancel()
+            response = await direct_task
+            return self._format_result({"answer": response.content})
+
+        direct_task.cancel()
+
+        if next_step == "pokemon_research" and research_task is not None:
+            return self._format_result(await research_task)
+        if research_task is not None:
+            research_task.cancel()
+
+        # The classify node re-runs inside the graph but hits the
+        # classification cache, so the extra pass is a dictionary lookup
+        final_state = await self.workflow.ainvoke(classified, config=_GRAPH_CONFIG)
+        return self._format_result(final_state["final_answer"])
+
+    @staticmethod
+    def _format_result(result: Any) -> Dict[str, Any]:
+        """Format a workflow result into the consistent answer/reasoning shape."""
         if isinstance(result, dict):
             # For battle analysis
             if "winner" in result and "reasoning" in result:
@@ -1,5 +1,11 @@
+import asyncio
 import os
+from functools import lru_cache
+from typing import Optional
+
+import httpx
 from dotenv import load_dotenv
+from langchain_anthropic import ChatAnthropic
 
 # Load environment variables from .env file
 load_dotenv()
@@ -7,12 +13,80 @@ load_dotenv()
 # Anthropic API key
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
 
-# LangSmith Configuration
-LANGCHAIN_TRACING_V2 = os.getenv("LANGCHAIN_TRACING_V2", "true")
+# LangSmith Configuration. Tracing defaults off unless an API key is
+# configured, so deployments without LangSmith don't pay per-node
+# callback latency; when tracing, callbacks post in the background
+# rather than blocking the request.
 LANGCHAIN_API_KEY = os.getenv("LANGCHAIN_API_KEY", "")
+LANGCHAIN_TRACING_V2 = os.getenv(
+    "LANGCHAIN_TRACING_V2", "true" if LANGCHAIN_API_KEY else "false")
 LANGCHAIN_PROJECT = os.getenv("LANGCHAIN_PROJECT", "pokemon-application")
+LANGCHAIN_CALLBACKS_BACKGROUND = os.getenv("LANGCHAIN_CALLBACKS_BACKGROUND", "true")
 
 # Set environment variables for LangSmith
 os.environ["LANGCHAIN_TRACING_V2"] = LANGCHAIN_TRACING_V2
-os.environ["LANGCHAIN_API_KEY"] = LANGCHAIN_API_KEY
+if LANGCHAIN_API_KEY:
+    os.environ["LANGCHAIN_API_KEY"] = LANGCHAIN_API_KEY
 os.environ["LANGCHAIN_PROJECT"] = LANGCHAIN_PROJECT
+os.environ["LANGCHAIN_CALLBACKS_BACKGROUND"] = LANGCHAIN_CALLBACKS_BACKGROUND
+
+
+# Default chat model shared by every agent; one name means every agent
+# resolves to the same cached ChatAnthropic client below
+DEFAULT_MODEL = os.getenv("POKEMON_MODEL", "claude-3-5-haiku-20241022")
+
+# PokeAPI cache sizing; data changes only with PokeAPI releases, so the
+# default TTL is a day, tunable per deployment
+POKEAPI_CACHE_SIZE = int(os.getenv("POKEAPI_CACHE_SIZE", "2048"))
+POKEAPI_CACHE_TTL = int(os.getenv("POKEAPI_CACHE_TTL", "86400"))
+
+
+@lru_cache(maxsize=4)
+def get_chat_model(model: str) -> ChatAnthropic:
+    """
+    Return a shared ChatAnthropic client for the given model.
+
+    All agents use the same client per model name, so the HTTP connection
+    pool and model configuration are set up once per process rather than
+    once per agent instance.
+    """
+    return ChatAnthropic(model=model, api_key=ANTHROPIC_API_KEY)
+
+
+# Shared async HTTP client, created lazily so it binds to the serving
+# event loop; all async PokeAPI traffic multiplexes over one pool
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared async HTTP client at application shutdown."""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = None
+
+
+# Cap on concurrent LLM calls; past the provider's rate limit extra
+# in-flight requests only queue server-side and grow tail latency
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def get_llm_semaphore() -> asyncio.Semaphore:
+    """Return the process-wide semaphore bounding concurrent LLM calls."""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    return _llm_semaphore
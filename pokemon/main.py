@@ -1,34 +1,92 @@
-import nest_asyncio
-nest_asyncio.apply()
-
 import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 from pokemon.core import config
 
 # Import routers
 from pokemon.routers import battle, chat
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the agent stack once per worker and tear shared state down with it."""
+    # Constructing here (not at import) keeps multi-worker cold starts off
+    # the import path; routers read the shared agents from app.state
+    from pokemon.agents.supervisor import SupervisorAgent
+    app.state.supervisor = SupervisorAgent()
+    app.state.expert = app.state.supervisor.expert
+
+    # Expose the shared pooled HTTP client; the researcher's async PokeAPI
+    # fetches already go through it, so handshakes amortize across requests
+    app.state.http = config.get_http_client()
+    # Shared bound on concurrent LLM calls (tunable via LLM_MAX_CONCURRENCY)
+    app.state.llm_sem = config.get_llm_semaphore()
+
+    # Compile the supervisor's graph now so the first request doesn't pay
+    # for it
+    _ = app.state.supervisor.workflow
+
+    # Optional network warmup: establish PokeAPI keep-alive sockets and
+    # prime the agent pipeline before the first user request lands
+    if os.environ.get("WARMUP_ON_STARTUP", "").lower() == "true":
+        try:
+            await app.state.http.get("https://pokeapi.co/api/v2/pokemon/1")
+            await app.state.supervisor.aprocess_question("warmup: who is pikachu?")
+        except Exception as e:
+            print(f"Startup warmup failed: {e}")
+
+    # Optional persistent LLM cache: repeated prompts across restarts
+    # resolve from SQLite instead of the provider
+    llm_cache_path = os.environ.get("LLM_CACHE_PATH", "")
+    if llm_cache_path:
+        try:
+            from langchain.globals import set_llm_cache
+            from langchain_community.cache import SQLiteCache
+            set_llm_cache(SQLiteCache(database_path=llm_cache_path))
+        except ImportError:
+            print("Failed to import langchain-community. "
+                  "Please install it to enable the SQLite LLM cache")
+
+    # Set up ngrok tunnel if enabled
+    if os.environ.get("USE_NGROK", "").lower() == "true":
+        try:
+            from pyngrok import ngrok
+            # Open a ngrok tunnel to the API
+            port = 8000
+            public_url = ngrok.connect(port).public_url
+            print(f"ngrok tunnel established at: {public_url}")
+            app.state.public_url = public_url
+        except ImportError:
+            print("Failed to import pyngrok. Please install it with 'pip install pyngrok'")
+        except Exception as e:
+            print(f"Failed to establish ngrok tunnel: {e}")
+
+    yield
+
+    # Close the shared async HTTP client's connection pool with the app
+    await config.aclose_http_client()
+
+
 # Create the FastAPI application
 app = FastAPI(
     title="Pokemon API",
     description="An API for Pokemon information, battles, and chat",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson serializes the nested answer/stats dicts faster than stdlib json
+    default_response_class=ORJSONResponse,
+    # Skip the second route lookup (and 307 round-trip) for trailing-slash
+    # variants of the API paths
+    redirect_slashes=False
 )
 
-# Set up ngrok tunnel if enabled
-if os.environ.get("USE_NGROK", "").lower() == "true":
-    try:
-        from pyngrok import ngrok
-        # Open a ngrok tunnel to the API
-        port = 8000
-        public_url = ngrok.connect(port).public_url
-        print(f"ngrok tunnel established at: {public_url}")
-        app.state.public_url = public_url
-    except ImportError:
-        print("Failed to import pyngrok. Please install it with 'pip install pyngrok'")
-    except Exception as e:
-        print(f"Failed to establish ngrok tunnel: {e}")
+# Compress larger responses (long reasoning strings dominate response
+# size); level 5 trades a little ratio for much less CPU than the default
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
 
 # Include routers
 app.include_router(battle.router, prefix="/api", tags=["battles"])
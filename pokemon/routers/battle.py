@@ -1,19 +1,37 @@
-from fastapi import APIRouter, HTTPException, Depends
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request
 from pokemon.agents.pokemon_expert import PokemonExpertAgent
 
 from langchain.callbacks.manager import tracing_v2_enabled
 
 router = APIRouter()
 
+# Validated in pydantic-core before the handler coroutine is scheduled,
+# replacing the old in-handler emptiness check
+PokemonName = Annotated[str, Query(min_length=1, max_length=32,
+                                   pattern=r"^[A-Za-z0-9-]+$")]
+
+
+# async so FastAPI resolves the dependency on the event loop instead of
+# dispatching it through the threadpool
+async def get_expert(request: Request) -> PokemonExpertAgent:
+    """Return the app-wide expert agent, creating it if the lifespan didn't run."""
+    expert = getattr(request.app.state, "expert", None)
+    if expert is None:
+        expert = PokemonExpertAgent()
+        request.app.state.expert = expert
+    return expert
+
+
 @router.get("/battle")
-async def battle(pokemon1: str, pokemon2: str):
+async def battle(pokemon1: PokemonName, pokemon2: PokemonName,
+                 expert: PokemonExpertAgent = Depends(get_expert)):
     """Determine the winner between two Pokémon using stats and Gemini reasoning."""
-    if not pokemon1 or not pokemon2:
-        raise HTTPException(status_code=400, detail="Two Pokémon names must be provided")
-    
     # Enable tracing for this specific endpoint with a dedicated project name
     with tracing_v2_enabled(project_name="pokemon-battles"):
-        expert = PokemonExpertAgent()
-        result = expert.determine_winner(pokemon1, pokemon2)
-    
+        # The async path fetches both Pokemon concurrently and keeps the
+        # event loop free during the LLM call
+        result = await expert.adetermine_winner(pokemon1, pokemon2)
+
     return result
@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, Request
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 from pokemon.agents.supervisor import SupervisorAgent
@@ -10,17 +10,32 @@ class QuestionRequest(BaseModel):
     question: str
 
 class AnswerResponse(BaseModel):
+    # Frozen lets pydantic-core skip __setattr__ hooks during construction
+    model_config = ConfigDict(frozen=True)
+
     answer: str
     reasoning: Optional[str] = None
 
+
+# async so FastAPI resolves the dependency on the event loop instead of
+# dispatching it through the threadpool
+async def get_supervisor(request: Request) -> SupervisorAgent:
+    """Return the app-wide supervisor agent, creating it if the lifespan didn't run."""
+    supervisor = getattr(request.app.state, "supervisor", None)
+    if supervisor is None:
+        supervisor = SupervisorAgent()
+        request.app.state.supervisor = supervisor
+    return supervisor
+
+
 @router.post("/chat", response_model=AnswerResponse)
-async def chat(request: QuestionRequest):
+async def chat(request: QuestionRequest,
+               supervisor: SupervisorAgent = Depends(get_supervisor)):
     """Process a user question using the supervisor agent."""
-    supervisor = SupervisorAgent()
-    result = supervisor.process_question(request.question)
-    
-    # Extract answer and reasoning
-    answer = result.get("answer", "")
-    reasoning = result.get("reasoning", None)
-    
-    return AnswerResponse(answer=answer, reasoning=reasoning)
\ No newline at end of file
+    # The async path runs the workflow with ainvoke, so the LLM and API
+    # calls inside the graph never block the event loop
+    result = await supervisor.aprocess_question(request.question)
+
+    # Return the plain dict and let response_model validate it once;
+    # constructing AnswerResponse here would validate the same payload twice
+    return {"answer": result.get("answer", ""), "reasoning": result.get("reasoning")}
@@ -5,11 +5,25 @@ if __name__ == "__main__":
     # Set up argument parsing
     parser = argparse.ArgumentParser(description="Run the Pokemon API server")
     parser.add_argument("--ngrok", action="store_true", help="Enable ngrok tunneling")
+    parser.add_argument("--reload", action="store_true",
+                        help="Enable auto-reload (development only)")
     args = parser.parse_args()
-    
+
     # Run with environment variable that our app can check
     import os
     if args.ngrok:
         os.environ["USE_NGROK"] = "true"
-    
-    uvicorn.run("pokemon.main:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+
+    uvicorn.run(
+        "pokemon.main:app",
+        host="0.0.0.0",
+        port=8000,
+        # The reload watcher forks a subprocess and is incompatible with
+        # multiple workers, so it is opt-in rather than always on
+        reload=args.reload,
+        workers=None if args.reload else int(os.environ.get("WEB_CONCURRENCY", "1")),
+        # "auto" picks uvloop and httptools when uvicorn[standard] is
+        # installed, and falls back to asyncio+h11 otherwise
+        loop="auto",
+        http="auto",
+    )
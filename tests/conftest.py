@@ -0,0 +1,13 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from pokemon.main import app
+
+
+@pytest.fixture()
+def client():
+    """Test client that runs the app lifespan, like a real server would."""
+    # Entering the context manager executes the lifespan, so tests
+    # exercise the same app.state agents the deployed app uses
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock, patch
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from pokemon.agents.pokemon_expert import PokemonExpertAgent, _ai_answer, _verdict_re
+
+
+def test_verdict_detection_ignores_echoed_question():
+    """The echoed input question must never count as an AI verdict."""
+    verdict_re = _verdict_re("pikachu", "charizard")
+    echo = HumanMessage(content=(
+        "Who would win in a battle between pikachu and charizard? "
+        "Analyze their types, stats, and abilities to determine a winner."
+    ))
+
+    # The query itself matches the verdict regex, so only AI messages
+    # may feed the verdict check
+    assert verdict_re.search(echo.content)
+    assert _ai_answer(echo) == ""
+
+    analysis = AIMessage(content="Based on its stats, Pikachu would win the battle.")
+    assert verdict_re.search(_ai_answer(analysis))
+
+
+def test_determine_winner_streams_past_echoed_input():
+    """The stream loop must not stop on the first step echoing the query."""
+    expert = PokemonExpertAgent()
+
+    query = HumanMessage(content=(
+        "Who would win in a battle between pikachu and charizard? "
+        "Analyze their types, stats, and abilities to determine a winner. "
+        "Provide detailed reasoning."
+    ))
+    analysis = AIMessage(content="Pikachu would win thanks to its speed advantage.")
+    steps = [
+        {"messages": [query]},
+        {"messages": [query, analysis]},
+    ]
+
+    with patch("pokemon.agents.pokemon_expert.fetch_pokemon_data", return_value={}), \
+         patch.object(expert.agent_executor, "stream", return_value=iter(steps)), \
+         patch("langchain_anthropic.ChatAnthropic.with_structured_output") as mock_structured:
+        mock_structured.return_value.invoke.return_value = MagicMock(
+            winner="Pikachu", reasoning="Speed advantage")
+        result = expert.determine_winner("pikachu", "charizard")
+
+    # The extraction prompt must carry the agent's analysis, not the question
+    prompt = mock_structured.return_value.invoke.call_args[0][0]
+    assert analysis.content in prompt
+    assert result["winner"] == "Pikachu"
@@ -1,13 +1,15 @@
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
 from pokemon.agents.researcher import ResearcherAgent, get_pokemon_data
 
 def test_get_pokemon_data():
     """Test the get_pokemon_data tool with mocked API responses."""
-    with patch("requests.get") as mock_get:
+    with patch("pokemon.agents.researcher._SESSION.get") as mock_get:
         # Setup mock response for successful API call
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "name": "pikachu",
             "id": 25,
             "types": [{"type": {"name": "electric"}}],
@@ -18,7 +20,7 @@ def test_get_pokemon_data():
             "height": 4,
             "weight": 60,
             "abilities": [{"ability": {"name": "static"}}]
-        }
+        }).encode()
         mock_response.raise_for_status = MagicMock()
         mock_get.return_value = mock_response
         
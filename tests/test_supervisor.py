@@ -5,7 +5,7 @@ from pokemon.agents.supervisor import SupervisorAgent, AgentState
 def test_classify_question():
     """Test the _classify_question method of SupervisorAgent."""
     # Create a supervisor agent
-    with patch("pokemon.agents.supervisor.ChatAnthropic"):
+    with patch("pokemon.agents.supervisor.get_chat_model"):
         with patch("pokemon.agents.researcher.ResearcherAgent"):
             with patch("pokemon.agents.pokemon_expert.PokemonExpertAgent"):
                 supervisor = SupervisorAgent()
@@ -58,7 +58,7 @@ def test_process_question(mock_state_graph):
     mock_graph.invoke.return_value = mock_final_state
     
     # Create the agent with mocks
-    with patch("pokemon.agents.supervisor.ChatAnthropic"):
+    with patch("pokemon.agents.supervisor.get_chat_model"):
         with patch("pokemon.agents.researcher.ResearcherAgent"):
             with patch("pokemon.agents.pokemon_expert.PokemonExpertAgent"):
                 supervisor = SupervisorAgent()